@@ -6,12 +6,13 @@ Provides command-line interface and examples
 
 import os
 import sys
+import queue
 import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
-# Import our OCR utility
-from ocr_utils import OCRProcessor, create_sample_image
-
 
 def main():
     """Main function with command-line interface"""
@@ -24,6 +25,9 @@ Examples:
   python main.py image.png --lang en          # Process with English only
   python main.py image.jpg --detailed         # Get detailed results
   python main.py --create-sample              # Create sample image for testing
+  python main.py --examples                   # Show Python API usage examples
+  ls *.jpg | python main.py --serve           # Keep models loaded, read paths from stdin
+  ls *.jpg | python main.py --serve --workers 4  # Same, across 4 worker processes
         """
     )
     
@@ -51,12 +55,30 @@ Examples:
         help='Create a sample image with English and Hindi text for testing'
     )
     
+    parser.add_argument(
+        '--examples',
+        action='store_true',
+        help='Show Python API usage examples'
+    )
+    
     parser.add_argument(
         '--gpu',
         action='store_true',
         help='Use GPU acceleration if available'
     )
     
+    parser.add_argument(
+        '--no-tensorrt',
+        action='store_true',
+        help='Disable TensorRT on the GPU path (default: used with --gpu when available)'
+    )
+    
+    parser.add_argument(
+        '--precision',
+        choices=['fp32', 'fp16', 'int8'],
+        help='Inference precision for the Paddle backend (default: fp16 with --gpu, otherwise fp32)'
+    )
+    
     parser.add_argument(
         '--languages',
         nargs='+',
@@ -64,10 +86,35 @@ Examples:
         help='Languages to initialize (default: en hi)'
     )
     
+    parser.add_argument(
+        '--backend',
+        choices=['paddle', 'onnxruntime', 'openvino'],
+        help='Inference backend (default: OpenVINO/ONNX Runtime on CPU when available, otherwise Paddle)'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Load the models once and process image paths read line by line from stdin'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for --serve, each holding its own models (default: 1)'
+    )
+    
     args = parser.parse_args()
     
+    # Handle examples option
+    if args.examples:
+        run_examples()
+        return
+    
     # Handle create sample option
     if args.create_sample:
+        from ocr_utils import create_sample_image
         print("Creating sample image...")
         if create_sample_image():
             print("✓ Sample image 'sample.jpg' created successfully!")
@@ -76,6 +123,11 @@ Examples:
             print("✗ Failed to create sample image")
         return
     
+    # Handle server mode
+    if args.serve:
+        serve(args)
+        return
+    
     # Check if image path is provided
     if not args.image_path:
         parser.print_help()
@@ -90,8 +142,17 @@ Examples:
     
     # Initialize OCR processor
     try:
+        from ocr_utils import OCRProcessor
         print(f"Initializing OCR processor with languages: {args.languages}")
-        ocr = OCRProcessor(languages=args.languages, use_gpu=args.gpu)
+        # A single image never pays back the warm-up cost; --serve keeps it
+        ocr = OCRProcessor(
+            languages=args.languages,
+            use_gpu=args.gpu,
+            backend=args.backend,
+            use_tensorrt=_use_tensorrt(args),
+            precision=args.precision,
+            warmup=False
+        )
         print("✓ OCR processor initialized successfully!")
         
     except Exception as e:
@@ -116,35 +177,167 @@ Examples:
         print(f"✗ Error processing image: {e}")
 
 
+# OCR processor held by each worker process, loaded once by _init_worker
+_OCR = None
+
+
+def _use_tensorrt(args):
+    """Map --no-tensorrt to OCRProcessor's use_tensorrt (None lets it auto-detect)"""
+    return False if args.no_tensorrt else None
+
+
+def _init_worker(languages, use_gpu, backend=None, cpu_threads=None, use_tensorrt=None, precision=None):
+    """Load the OCR models once per worker process"""
+    global _OCR
+    from ocr_utils import OCRProcessor
+    _OCR = OCRProcessor(
+        languages=languages,
+        use_gpu=use_gpu,
+        backend=backend,
+        cpu_threads=cpu_threads,
+        use_tensorrt=use_tensorrt,
+        precision=precision
+    )
+
+
+def _process_path(image_path, language, detailed):
+    """Run OCR on one image using the worker's resident processor"""
+    if detailed:
+        return _OCR.get_detailed_results(image_path, language)
+    return _OCR.extract_text_only(image_path, language)
+
+
+def _read_paths(stream):
+    """Yield non-empty image paths from a line-oriented stream"""
+    for line in stream:
+        image_path = line.strip()
+        if image_path:
+            yield image_path
+
+
+def serve(args):
+    """Keep OCR models resident and process image paths from stdin"""
+    print(f"Initializing OCR processor with languages: {args.languages}", file=sys.stderr)
+    
+    if args.workers > 1:
+        # Split the cores between workers so their inference threads don't oversubscribe the CPU
+        cpu_threads = max(1, (os.cpu_count() or 1) // args.workers)
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.languages, args.gpu, args.backend, cpu_threads, _use_tensorrt(args), args.precision)
+        ) as executor:
+            # Submit paths as they arrive; a printer thread emits results in input order
+            pending = queue.Queue()
+            pool_errors = []
+            printer = threading.Thread(
+                target=_print_in_order,
+                args=(pending, args.detailed, pool_errors),
+                daemon=True
+            )
+            printer.start()
+            try:
+                for image_path in _read_paths(sys.stdin):
+                    pending.put((image_path, executor.submit(_process_path, image_path, args.lang, args.detailed)))
+            except BrokenProcessPool as e:
+                pool_errors.append(e)
+            finally:
+                # Always stop the printer, even if submitting failed or was interrupted
+                pending.put(None)
+                printer.join()
+        
+        # A broken pool means a worker's initializer failed to load the models
+        if pool_errors:
+            print(f"✗ Failed to initialize OCR processor: {pool_errors[0]}", file=sys.stderr)
+            print("Please ensure all dependencies are installed: pip install -r requirements.txt", file=sys.stderr)
+        return
+    
+    try:
+        _init_worker(
+            args.languages, args.gpu, args.backend,
+            use_tensorrt=_use_tensorrt(args), precision=args.precision
+        )
+    except Exception as e:
+        print(f"✗ Failed to initialize OCR processor: {e}", file=sys.stderr)
+        return
+    print("✓ OCR processor ready, reading image paths from stdin", file=sys.stderr)
+    
+    for image_path in _read_paths(sys.stdin):
+        try:
+            _print_served_result(image_path, _process_path(image_path, args.lang, args.detailed), args.detailed)
+        except Exception as e:
+            print(f"✗ Error processing image {image_path}: {e}")
+        sys.stdout.flush()
+
+
+def _print_in_order(pending, detailed, pool_errors):
+    """
+    Print (path, future) pairs from a queue in order until a None sentinel
+    
+    Futures failing because the worker pool broke are collected in
+    pool_errors instead of being reported once per image.
+    """
+    while True:
+        item = pending.get()
+        if item is None:
+            return
+        image_path, future = item
+        try:
+            _print_served_result(image_path, future.result(), detailed)
+        except BrokenProcessPool as e:
+            pool_errors.append(e)
+        except Exception as e:
+            print(f"✗ Error processing image {image_path}: {e}")
+        sys.stdout.flush()
+
+
+def _print_served_result(image_path, result, detailed):
+    """Print the result for one image processed in server mode"""
+    print(f"\nProcessing image: {image_path}")
+    if detailed:
+        print_results_detailed(result)
+    else:
+        print_results_simple(result)
+
+
 def print_results_simple(texts):
     """Print simple text results"""
-    print(f"\n=== OCR Results ===")
+    lines = ["", "=== OCR Results ==="]
     if texts:
-        print(f"Detected {len(texts)} text elements:")
-        for i, text in enumerate(texts, 1):
-            print(f"  {i}. {text}")
+        lines.append(f"Detected {len(texts)} text elements:")
+        lines.extend(f"  {i}. {text}" for i, text in enumerate(texts, 1))
     else:
-        print("No text detected in the image.")
+        lines.append("No text detected in the image.")
+    
+    # Build the whole report first so it goes out in a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_results_detailed(results):
     """Print detailed OCR results"""
-    print(f"\n=== Detailed OCR Results ===")
-    print(f"Summary: {results['summary']}")
-    print(f"Languages detected: {', '.join(results['languages_detected'])}")
-    print(f"Average confidence: {results['average_confidence']:.1%}")
+    lines = [
+        "",
+        "=== Detailed OCR Results ===",
+        f"Summary: {results['summary']}",
+        f"Languages detected: {', '.join(results['languages_detected'])}",
+        f"Average confidence: {results['average_confidence']:.1%}",
+    ]
     
     if results['results']:
-        print(f"\nDetailed results:")
+        lines.append("")
+        lines.append("Detailed results:")
         for i, result in enumerate(results['results'], 1):
-            print(f"  {i}. Text: '{result['text']}'")
-            print(f"     Language: {result['language']}")
-            print(f"     Confidence: {result['confidence']:.1%}")
-            print(f"     Position: Center at ({result['center'][0]:.1f}, {result['center'][1]:.1f})")
-            print(f"     Size: {result['dimensions'][0]:.1f} x {result['dimensions'][1]:.1f}")
-            print()
+            lines.append(f"  {i}. Text: '{result['text']}'")
+            lines.append(f"     Language: {result['language']}")
+            lines.append(f"     Confidence: {result['confidence']:.1%}")
+            lines.append(f"     Position: Center at ({result['center'][0]:.1f}, {result['center'][1]:.1f})")
+            lines.append(f"     Size: {result['dimensions'][0]:.1f} x {result['dimensions'][1]:.1f}")
+            lines.append("")
     else:
-        print("No text detected in the image.")
+        lines.append("No text detected in the image.")
+    
+    # Build the whole report first so it goes out in a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def run_examples():
@@ -174,19 +367,14 @@ def run_examples():
     print("   print(f\"Average confidence: {detailed['average_confidence']}\")")
     print()
     
-    # Example 4: Batch processing (future extension)
-    print("4. Batch Processing (Future Extension):")
-    print("   # This could be extended to process multiple images")
+    # Example 4: Batch processing
+    print("4. Batch Processing:")
     print("   image_paths = ['img1.jpg', 'img2.jpg', 'img3.jpg']")
-    print("   for img_path in image_paths:")
-    print("       texts = ocr.extract_text_only(img_path)")
-    print("       print(f\"{img_path}: {texts}\")")
+    print("   batch_results = ocr.process_images(image_paths, batch_size=8)")
+    print("   for img_path, results in zip(image_paths, batch_results):")
+    print("       print(f\"{img_path}: {[r['text'] for r in results]}\")")
     print()
 
 
 if __name__ == "__main__":
-    # Check if running with --examples flag
-    if len(sys.argv) > 1 and sys.argv[1] == '--examples':
-        run_examples()
-    else:
-        main() 
\ No newline at end of file
+    main() 
\ No newline at end of file
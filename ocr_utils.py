@@ -5,15 +5,23 @@ Supports multiple languages including English and Hindi
 """
 
 import os
+import gc
+import mmap
+import ctypes
+import ctypes.util
+import hashlib
 import logging
+import importlib
+import importlib.util
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 try:
-    from paddleocr import PaddleOCR
     import cv2
     import numpy as np
-    from PIL import Image
+    from PIL import Image, ImageDraw, ImageFont, features
 except ImportError as e:
     print(f"Error: Missing required dependencies. Please install them first: {e}")
     print("Run: pip install -r requirements.txt")
@@ -23,44 +31,286 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Magic bytes of the image formats OpenCV can decode (WEBP is checked separately)
+IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',          # JPEG
+    b'\x89PNG\r\n\x1a\n',     # PNG
+    b'BM',                    # BMP
+    b'II*\x00',               # TIFF (little-endian)
+    b'MM\x00*',               # TIFF (big-endian)
+)
+
+# Vertical distance (px) within which PaddleOCR treats two boxes as one line
+BOX_SAME_LINE_TOLERANCE = 10
+
+# Pages with at least this many boxes use the Numba bbox kernel when available
+NUMBA_MIN_BOXES = 256
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Fonts for create_sample_image; Devanagari needs a font that covers its glyphs
+ENGLISH_FONTS = ('DejaVuSans.ttf', 'Arial.ttf', 'arial.ttf')
+DEVANAGARI_FONTS = ('NotoSansDevanagari-Regular.ttf', 'Lohit-Devanagari.ttf', 'Nirmala.ttf', 'mangal.ttf')
+
+# RapidOCR packages serving the PP-OCR models through ONNX Runtime / OpenVINO
+RAPIDOCR_BACKENDS = {
+    'onnxruntime': 'rapidocr_onnxruntime',
+    'openvino': 'rapidocr_openvino',
+}
+
+# Languages recognized by RapidOCR's bundled (Chinese + English) PP-OCR model
+RAPIDOCR_LANGUAGES = {'en', 'ch'}
+
 
 class OCRProcessor:
     """Main OCR processor class using PaddleOCR"""
     
-    def __init__(self, languages: List[str] = None, use_gpu: bool = False):
+    def __init__(self, languages: List[str] = None, use_gpu: bool = False,
+                 enable_mkldnn: Optional[bool] = None, rec_batch_num: Optional[int] = None,
+                 cpu_threads: Optional[int] = None, cache_size: int = 256,
+                 backend: Optional[str] = None, precision: Optional[str] = None,
+                 use_tensorrt: Optional[bool] = None, max_batch_size: int = 16,
+                 det_limit_side_len: int = 960, warmup: bool = True,
+                 images_per_reset: Optional[int] = None):
         """
         Initialize OCR processor
         
         Args:
             languages: List of language codes (e.g., ['en', 'hi'])
             use_gpu: Whether to use GPU acceleration
+            enable_mkldnn: Use MKLDNN kernels on CPU (default: on when not using GPU)
+            rec_batch_num: Recognizer batch size (default: 1 on CPU, 6 on GPU)
+            cpu_threads: Number of CPU inference threads (default: all cores)
+            cache_size: Number of per-image results to memoize (0 disables caching)
+            backend: Inference backend, one of 'paddle', 'onnxruntime' or 'openvino'
+                (default: OpenVINO/ONNX Runtime on CPU when installed and all
+                languages are supported, otherwise Paddle)
+            precision: Paddle inference precision, 'fp32', 'fp16' or 'int8'
+                (default: 'fp16' on GPU, 'fp32' on CPU)
+            use_tensorrt: Build TensorRT engines for the Paddle GPU path (default: on
+                with use_gpu when Paddle has TensorRT and its runtime loads)
+            max_batch_size: Largest batch TensorRT engines are built for
+            det_limit_side_len: Longest image side fed to the Paddle text detector
+            warmup: Run dummy inputs through the models at startup so kernel
+                selection and engine building don't slow down the first image
+            images_per_reset: Rebuild the models after this many images to return
+                Paddle's inference memory to the OS (0 disables; default: 1000
+                for the Paddle backend, 0 for RapidOCR backends)
         """
         if languages is None:
             languages = ['en', 'hi']  # Default: English + Hindi
         
         self.languages = languages
         self.use_gpu = use_gpu
+        # CPU gains nothing from batching recognition, while Paddle sizes its
+        # memory arena by batch size, so keep batches small unless on GPU
+        self.enable_mkldnn = (not use_gpu) if enable_mkldnn is None else enable_mkldnn
+        self.rec_batch_num = (6 if use_gpu else 1) if rec_batch_num is None else rec_batch_num
+        self.cpu_threads = (os.cpu_count() or 1) if cpu_threads is None else cpu_threads
+        self.precision = ('fp16' if use_gpu else 'fp32') if precision is None else precision
+        self.use_tensorrt = use_tensorrt  # None: decided once Paddle is imported
+        self.max_batch_size = max_batch_size
+        self.det_limit_side_len = det_limit_side_len
+        self.warmup = warmup
+        self._images_since_reset = 0
+        self._closed = False
         self.ocr_models = {}
+        self._decoded_image = (None, None)  # ((path, mtime), image)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # (sha1, languages[, 'text']) -> results, in LRU order
+        self.backend = self._select_backend(backend)
+        # Only Paddle inference holds on to its per-call memory arenas
+        if images_per_reset is None:
+            images_per_reset = 1000 if self.backend == 'paddle' else 0
+        self.images_per_reset = images_per_reset
         
         # Initialize OCR models for each language
         self._initialize_models()
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the OCR models and return their memory to the OS"""
+        self._closed = True
+        self.ocr_models.clear()
+        self.base_ocr = None
+        self._decoded_image = (None, None)
+        gc.collect()
+        _malloc_trim()
+    
+    def reset(self):
+        """
+        Tear down and rebuild the OCR models
+        
+        Paddle inference keeps its per-call memory arenas for the life of a
+        predictor, so resident memory grows in long-running processes.
+        Rebuilding the predictors and trimming the heap bounds it; starting
+        the process with MALLOC_ARENA_MAX=2 further limits glibc's arenas.
+        """
+        logger.info("Resetting OCR models to release inference memory")
+        self.close()
+        self._images_since_reset = 0
+        self._initialize_models()
+        self._closed = False
+    
+    def _ensure_open(self):
+        """Raise if close() was called or a reset failed to rebuild the models"""
+        if self._closed:
+            raise RuntimeError("OCRProcessor is closed")
+    
+    def _prepare_call(self):
+        """
+        Check the processor is usable and apply any pending periodic reset
+        
+        The reset runs here, before new work starts, rather than after an
+        image finishes, so a failed rebuild never discards a computed result.
+        """
+        self._ensure_open()
+        if self.images_per_reset > 0 and self._images_since_reset >= self.images_per_reset:
+            self.reset()
+    
+    def _count_processed(self, image_count: int):
+        """Track processed images towards the next periodic reset"""
+        self._images_since_reset += image_count
+    
+    def _select_backend(self, backend: Optional[str]) -> str:
+        """Validate the requested backend or pick the fastest usable one"""
+        if backend is not None:
+            if backend != 'paddle' and backend not in RAPIDOCR_BACKENDS:
+                raise ValueError(f"Unknown backend '{backend}'. Available: {['paddle'] + list(RAPIDOCR_BACKENDS)}")
+            if backend != 'paddle' and not set(self.languages) <= RAPIDOCR_LANGUAGES:
+                raise ValueError(f"Backend '{backend}' only supports languages {sorted(RAPIDOCR_LANGUAGES)}")
+            return backend
+        
+        if not self.use_gpu and set(self.languages) <= RAPIDOCR_LANGUAGES:
+            for name in ('openvino', 'onnxruntime'):
+                if importlib.util.find_spec(RAPIDOCR_BACKENDS[name]) is not None:
+                    return name
+        return 'paddle'
+    
     def _initialize_models(self):
-        """Initialize PaddleOCR models for specified languages"""
+        """Initialize OCR models for specified languages"""
         try:
-            for lang in self.languages:
-                logger.info(f"Initializing PaddleOCR model for language: {lang}")
-                self.ocr_models[lang] = PaddleOCR(
-                    use_angle_cls=True,
-                    lang=lang,
-                    use_gpu=self.use_gpu,
-                    show_log=False
-                )
+            if self.backend == 'paddle':
+                self._initialize_paddle_models()
+            else:
+                self._initialize_rapidocr_models()
+            
+            if self.warmup:
+                self._warmup()
             logger.info("All OCR models initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize OCR models: {e}")
             raise
     
+    def _initialize_paddle_models(self):
+        """
+        Initialize one PaddleOCR model per language
+        
+        Only the primary (first) language keeps its detector and angle
+        classifier; the remaining languages contribute just their recognizer,
+        so detection runs once per image regardless of the language count.
+        """
+        # Imported here so the CLI and create_sample_image don't pay for Paddle
+        from paddleocr import PaddleOCR
+        
+        if self.use_gpu:
+            self._check_gpu()
+        if self.use_tensorrt is None:
+            self.use_tensorrt = self.use_gpu and _tensorrt_available()
+        
+        for lang in self.languages:
+            logger.info(f"Initializing PaddleOCR model for language: {lang}")
+            is_primary = lang == self.languages[0]
+            model = PaddleOCR(
+                use_angle_cls=is_primary,
+                lang=lang,
+                use_gpu=self.use_gpu,
+                enable_mkldnn=self.enable_mkldnn,
+                cpu_threads=self.cpu_threads,
+                rec_batch_num=self.rec_batch_num,
+                use_tensorrt=self.use_tensorrt,
+                precision=self.precision,
+                max_batch_size=self.max_batch_size,
+                min_subgraph_size=15,
+                det_limit_side_len=self.det_limit_side_len,
+                show_log=False
+            )
+            if not is_primary:
+                # Drop the duplicate detector so its weights can be freed
+                model.text_detector = None
+            self.ocr_models[lang] = model
+        self.base_ocr = self.ocr_models[self.languages[0]]
+        
+        if self.use_gpu:
+            self._verify_gpu_predictors()
+    
+    def _check_gpu(self):
+        """Fail fast if GPU inference was requested but Paddle cannot use CUDA"""
+        import paddle
+        if not paddle.device.is_compiled_with_cuda():
+            raise RuntimeError(
+                "GPU requested but the installed Paddle was built without CUDA. "
+                "Install paddlepaddle-gpu matching your CUDA version, or run without GPU."
+            )
+        device_count = paddle.device.cuda.device_count()
+        if device_count == 0:
+            raise RuntimeError(
+                "GPU requested but Paddle sees no CUDA device. "
+                "Check the NVIDIA driver and CUDA_VISIBLE_DEVICES."
+            )
+        logger.info(f"Using Paddle {paddle.__version__} with CUDA {paddle.version.cuda()} on {device_count} GPU(s)")
+    
+    def _verify_gpu_predictors(self):
+        """Warn if any Paddle predictor was created for CPU despite use_gpu"""
+        predictors = [self.base_ocr.text_detector, self.base_ocr.text_classifier]
+        predictors += [self.ocr_models[lang].text_recognizer for lang in self.languages]
+        for predictor in predictors:
+            config = getattr(predictor, 'config', None)
+            if config is not None and not config.use_gpu():
+                logger.warning(
+                    "GPU requested but PaddleOCR created a CPU predictor - inference is silently "
+                    "falling back to CPU. Check that paddlepaddle-gpu matches your CUDA/cuDNN install."
+                )
+                return
+    
+    def _warmup(self):
+        """
+        Run dummy inputs through every model to finish lazy kernel setup
+        
+        cuDNN autotuning, MKLDNN primitive creation and TensorRT engine
+        building all happen on the first inference; doing it here keeps that
+        cost out of the first real request.
+        """
+        logger.info("Warming up OCR models")
+        try:
+            self.base_ocr.text_detector(np.zeros((640, 640, 3), dtype=np.uint8))
+            
+            # A full recognizer batch, at the recognizer's input size
+            dummy_crops = [np.zeros((48, 320, 3), dtype=np.uint8) for _ in range(self.rec_batch_num)]
+            self.base_ocr.text_classifier(dummy_crops)
+            # Languages may share one engine (RapidOCR); warm each engine once
+            for model in {id(model): model for model in self.ocr_models.values()}.values():
+                model.text_recognizer(dummy_crops)
+        except Exception as e:
+            logger.warning(f"OCR model warm-up failed, the first image will be slower: {e}")
+    
+    def _initialize_rapidocr_models(self):
+        """
+        Initialize a single RapidOCR engine shared by all languages
+        
+        The bundled model recognizes Chinese and English together, so every
+        language maps to the same engine and it is run once per image.
+        """
+        logger.info(f"Initializing RapidOCR model with {self.backend} backend for languages: {self.languages}")
+        rapidocr = importlib.import_module(RAPIDOCR_BACKENDS[self.backend])
+        self.base_ocr = _RapidOCRAdapter(rapidocr.RapidOCR())
+        for lang in self.languages:
+            self.ocr_models[lang] = self.base_ocr
+    
     def process_image(self, image_path: str, language: str = None) -> List[Dict]:
         """
         Process a single image with OCR
@@ -72,39 +322,274 @@ class OCRProcessor:
         Returns:
             List of dictionaries containing text detection results
         """
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+        return self._process_image_columns(image_path, language).to_dicts()
+    
+    def _process_image_columns(self, image_path: str, language: str = None) -> 'OCRBatchResult':
+        """Run OCR on one image and return the detections in columnar form"""
+        return self._process_image_cached(image_path, language, text_only=False)
+    
+    def _process_image_text_only(self, image_path: str, language: str = None) -> List[str]:
+        """Run OCR on one image and return only the non-empty texts"""
+        return list(self._process_image_cached(image_path, language, text_only=True))
+    
+    def _process_image_cached(self, image_path: str, language: str, text_only: bool):
+        """
+        Run OCR on one image, memoizing the result by file content
         
-        # Validate image file
-        if not self._is_valid_image(image_path):
-            raise ValueError(f"Invalid image file: {image_path}")
+        Args:
+            image_path: Path to the image file
+            language: Specific language to use (if None, uses all initialized languages)
+            text_only: Skip bounding-box post-processing and return only texts
+            
+        Returns:
+            List of texts if text_only, otherwise an OCRBatchResult
+        """
+        self._prepare_call()
+        self._validate_image_path(image_path)
+        languages_to_use = self._resolve_languages(language)
         
-        # Determine which languages to use
-        if language:
-            if language not in self.ocr_models:
-                raise ValueError(f"Language '{language}' not initialized. Available: {list(self.ocr_models.keys())}")
-            languages_to_use = [language]
-        else:
-            languages_to_use = self.languages
+        # Identical file contents with the same languages give identical results
+        cache_key = (self._file_digest(image_path), tuple(languages_to_use))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return [text for text in cached.texts if text.strip()] if text_only else cached
+        if text_only:
+            cache_key += ('text',)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        img = self._load_image(image_path)
+        
+        # Detect text regions once and share the crops between all languages
+        boxes, crops = self._detect_text_regions(img)
         
         results = []
+        failed = False
         
         for lang in languages_to_use:
             try:
                 logger.info(f"Processing image with {lang} language model")
-                ocr_result = self.ocr_models[lang].ocr(image_path, cls=True)
+                ocr_result = self._recognize_text_regions(boxes, crops, lang)
                 
                 # Process results
-                processed_results = self._process_ocr_results(ocr_result, lang)
-                results.extend(processed_results)
+                if text_only:
+                    results.extend(self._process_ocr_results_text_only(ocr_result, lang))
+                else:
+                    results.append(self._process_ocr_results(ocr_result, lang))
                 
             except Exception as e:
                 logger.error(f"Error processing image with {lang} language: {e}")
+                failed = True
                 continue
         
+        if not text_only:
+            results = OCRBatchResult.concatenate(results)
+        
+        # Only memoize complete results so a transient failure is retried
+        if not failed:
+            self._cache_put(cache_key, results)
+        
+        self._count_processed(1)
         return results
     
-    def _process_ocr_results(self, ocr_result: List, language: str) -> List[Dict]:
+    def _cache_get(self, key: Tuple):
+        """Return a memoized result and mark it recently used, or None"""
+        if key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+    
+    def _cache_put(self, key: Tuple, value):
+        """Memoize a result, evicting the least recently used entry if full"""
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def process_images(self, images: List, batch_size: int = 8, language: str = None) -> List[List[Dict]]:
+        """
+        Process several images, batching recognition across them
+        
+        Detection runs per image, but the text crops of up to ``batch_size``
+        images are pooled so each language's recognizer is invoked once per
+        batch instead of once per image.
+        
+        Args:
+            images: Image file paths and/or decoded BGR arrays
+            batch_size: Number of images whose crops are recognized together
+            language: Specific language to use (if None, uses all initialized languages)
+            
+        Returns:
+            One list of result dictionaries per input image, in input order;
+            images that fail to load or detect yield an empty list
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        
+        self._ensure_open()
+        languages_to_use = self._resolve_languages(language)
+        all_results = []
+        
+        for start in range(0, len(images), batch_size):
+            # Periodic resets happen between batches, never discarding finished ones
+            self._prepare_call()
+            batch = images[start:start + batch_size]
+            detections = [self._detect_batch_image(image, start + idx) for idx, image in enumerate(batch)]
+            pooled_crops = [crop for _, crops in detections for crop in crops]
+            batch_results = [[] for _ in batch]
+            
+            for lang in languages_to_use:
+                try:
+                    logger.info(f"Recognizing {len(pooled_crops)} text regions with {lang} language model")
+                    rec_res = self.ocr_models[lang].text_recognizer(pooled_crops)[0] if pooled_crops else []
+                except Exception as e:
+                    logger.error(f"Error processing batch with {lang} language: {e}")
+                    continue
+                
+                # Split the pooled recognitions back out per image
+                offset = 0
+                for idx, (boxes, crops) in enumerate(detections):
+                    ocr_result = self._build_ocr_result(boxes, rec_res[offset:offset + len(crops)])
+                    offset += len(crops)
+                    batch_results[idx].append(self._process_ocr_results(ocr_result, lang))
+            
+            all_results.extend(OCRBatchResult.concatenate(parts).to_dicts() for parts in batch_results)
+            self._count_processed(len(batch))
+        
+        return all_results
+    
+    def _detect_batch_image(self, image, index: int) -> Tuple[List, List[np.ndarray]]:
+        """Load and detect one batch image, yielding no regions if it fails"""
+        try:
+            img = image if isinstance(image, np.ndarray) else self._read_image(image)
+            return self._detect_text_regions(img)
+        except Exception as e:
+            name = image if isinstance(image, str) else f"#{index}"
+            logger.error(f"Error processing image {name}: {e}")
+            return [], []
+    
+    def _resolve_languages(self, language: str = None) -> List[str]:
+        """Return the languages to run, validating an explicit choice"""
+        if language:
+            if language not in self.ocr_models:
+                raise ValueError(f"Language '{language}' not initialized. Available: {list(self.ocr_models.keys())}")
+            return [language]
+        
+        # Languages sharing one engine (RapidOCR) would repeat the same recognition,
+        # so run each engine once under the first language that uses it
+        languages_to_use = []
+        seen_models = set()
+        for lang in self.languages:
+            if id(self.ocr_models[lang]) not in seen_models:
+                seen_models.add(id(self.ocr_models[lang]))
+                languages_to_use.append(lang)
+        return languages_to_use
+    
+    def _read_image(self, image_path: str) -> np.ndarray:
+        """Validate an image path and return the decoded image"""
+        self._validate_image_path(image_path)
+        return self._load_image(image_path)
+    
+    def _validate_image_path(self, image_path: str):
+        """Raise if the path does not point to a readable image"""
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+        
+        # Validate image file
+        if not self._is_valid_image(image_path):
+            raise ValueError(f"Invalid image file: {image_path}")
+    
+    def _file_digest(self, image_path: str) -> str:
+        """Return the SHA-1 hex digest of a file's contents"""
+        # Hash straight from a memory map so the file is never copied into Python bytes
+        with open(image_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
+    
+    def _load_image(self, image_path: str) -> np.ndarray:
+        """
+        Decode an image, reusing the last decode if the file is unchanged
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            Decoded BGR image
+        """
+        key = (os.path.abspath(image_path), os.path.getmtime(image_path))
+        cached_key, cached_img = self._decoded_image
+        if cached_key == key:
+            return cached_img
+        
+        img = cv2.imread(image_path, cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError(f"Could not decode image file: {image_path}")
+        
+        self._decoded_image = (key, img)
+        return img
+    
+    def _detect_text_regions(self, img: np.ndarray) -> Tuple[List, List[np.ndarray]]:
+        """
+        Run the shared detector and angle classifier on an image
+        
+        Args:
+            img: Decoded BGR image
+            
+        Returns:
+            Tuple of (bounding boxes, upright text crops) in reading order
+        """
+        # PaddleOCR's detector would shrink large images anyway; do it up front
+        # with INTER_AREA and map the boxes back so crops come from full
+        # resolution. RapidOCR applies its own resize policy, so leave it alone.
+        scale = 1.0
+        if self.backend == 'paddle':
+            scale = self.det_limit_side_len / max(img.shape[:2])
+        if scale < 1.0:
+            det_img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            det_img = img
+        
+        dt_boxes, _ = self.base_ocr.text_detector(det_img)
+        if dt_boxes is None or len(dt_boxes) == 0:
+            return [], []
+        
+        if scale < 1.0:
+            dt_boxes = np.asarray(dt_boxes, dtype=np.float32) / scale
+        
+        boxes = _sort_boxes([box.tolist() for box in dt_boxes])
+        crops = [_crop_text_region(img, box) for box in boxes]
+        crops, _, _ = self.base_ocr.text_classifier(crops)
+        return boxes, crops
+    
+    def _recognize_text_regions(self, boxes: List, crops: List[np.ndarray], language: str) -> List:
+        """
+        Recognize pre-detected text crops with a language's recognizer
+        
+        Args:
+            boxes: Bounding boxes returned by _detect_text_regions
+            crops: Text crops returned by _detect_text_regions
+            language: Language code whose recognizer to use
+            
+        Returns:
+            Raw OCR result in the same layout as PaddleOCR.ocr()
+        """
+        if not crops:
+            return [[]]
+        
+        rec_res, _ = self.ocr_models[language].text_recognizer(crops)
+        return self._build_ocr_result(boxes, rec_res)
+    
+    def _build_ocr_result(self, boxes: List, rec_res: List) -> List:
+        """Pair boxes with recognitions, dropping low-confidence lines"""
+        drop_score = self.base_ocr.drop_score
+        return [[
+            [box, (text, score)]
+            for box, (text, score) in zip(boxes, rec_res)
+            if score >= drop_score
+        ]]
+    
+    def _process_ocr_results(self, ocr_result: List, language: str) -> 'OCRBatchResult':
         """
         Process raw OCR results into structured format
         
@@ -113,53 +598,74 @@ class OCRProcessor:
             language: Language code used for detection
             
         Returns:
-            List of processed results
+            Columnar result with one row per detected text line
+        """
+        if not ocr_result or not ocr_result[0]:
+            return OCRBatchResult.empty()
+        
+        lines = [line for line in ocr_result[0] if len(line) >= 2]
+        if not lines:
+            return OCRBatchResult.empty()
+        
+        texts = []
+        confidences = []
+        for line in lines:
+            # Extract text and confidence
+            text_info = line[1]
+            if isinstance(text_info, tuple) and len(text_info) >= 2:
+                texts.append(text_info[0])
+                confidences.append(float(text_info[1]))
+            else:
+                texts.append(str(text_info))
+                confidences.append(1.0)
+        
+        # Calculate every bounding box center and dimension in one pass
+        bboxes = np.asarray([line[0] for line in lines], dtype=np.float32)  # (N, 4, 2)
+        centers, dims = _bbox_stats(bboxes)
+        
+        return OCRBatchResult(
+            texts=texts,
+            confidences=np.asarray(confidences, dtype=np.float64),
+            languages=np.full(len(texts), language),
+            bboxes=bboxes,
+            centers=centers,
+            dims=dims
+        )
+    
+    def _process_ocr_results_text_only(self, ocr_result: List, language: str) -> List[str]:
         """
-        processed_results = []
+        Extract the non-empty texts from raw OCR results, skipping box math
         
+        Args:
+            ocr_result: Raw OCR result from PaddleOCR
+            language: Language code used for detection
+            
+        Returns:
+            List of detected text strings
+        """
         if not ocr_result or not ocr_result[0]:
-            return processed_results
+            return []
         
+        texts = []
         for line in ocr_result[0]:
             if len(line) >= 2:
-                # Extract bounding box coordinates
-                bbox = line[0]  # [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-                
-                # Extract text and confidence
                 text_info = line[1]
-                if isinstance(text_info, tuple) and len(text_info) >= 2:
-                    text = text_info[0]
-                    confidence = text_info[1]
-                else:
-                    text = str(text_info)
-                    confidence = 1.0
-                
-                # Calculate bounding box center and dimensions
-                bbox_array = np.array(bbox)
-                center_x = np.mean(bbox_array[:, 0])
-                center_y = np.mean(bbox_array[:, 1])
-                width = np.max(bbox_array[:, 0]) - np.min(bbox_array[:, 0])
-                height = np.max(bbox_array[:, 1]) - np.min(bbox_array[:, 1])
-                
-                processed_results.append({
-                    'text': text,
-                    'confidence': float(confidence),
-                    'language': language,
-                    'bbox': bbox,
-                    'center': (float(center_x), float(center_y)),
-                    'dimensions': (float(width), float(height))
-                })
-        
-        return processed_results
+                text = text_info[0] if isinstance(text_info, tuple) and len(text_info) >= 2 else str(text_info)
+                if text.strip():
+                    texts.append(text)
+        return texts
     
     def _is_valid_image(self, image_path: str) -> bool:
-        """Check if the file is a valid image"""
+        """Check if the file starts with a supported image signature"""
         try:
-            with Image.open(image_path) as img:
-                img.verify()
-            return True
-        except Exception:
+            with open(image_path, 'rb') as f:
+                header = f.read(32)
+        except OSError:
             return False
+        
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return True
+        return header.startswith(IMAGE_SIGNATURES)
     
     def extract_text_only(self, image_path: str, language: str = None) -> List[str]:
         """
@@ -172,8 +678,7 @@ class OCRProcessor:
         Returns:
             List of detected text strings
         """
-        results = self.process_image(image_path, language)
-        return [result['text'] for result in results if result['text'].strip()]
+        return self._process_image_text_only(image_path, language)
     
     def get_detailed_results(self, image_path: str, language: str = None) -> Dict:
         """
@@ -186,9 +691,9 @@ class OCRProcessor:
         Returns:
             Dictionary containing detailed results and statistics
         """
-        results = self.process_image(image_path, language)
+        result = self._process_image_columns(image_path, language)
         
-        if not results:
+        if not len(result):
             return {
                 'text_count': 0,
                 'languages_detected': [],
@@ -197,19 +702,17 @@ class OCRProcessor:
                 'summary': 'No text detected'
             }
         
-        # Calculate statistics
-        text_count = len(results)
-        languages_detected = list(set(result['language'] for result in results))
-        confidences = [result['confidence'] for result in results]
-        average_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        # Calculate statistics over the columns
+        text_count = len(result)
+        average_confidence = float(result.confidences.mean())
         
-        # Group by language
+        # Group by language in the same pass that builds the result dicts
+        results = []
         results_by_language = {}
-        for result in results:
-            lang = result['language']
-            if lang not in results_by_language:
-                results_by_language[lang] = []
-            results_by_language[lang].append(result)
+        for entry in result.to_dicts():
+            results.append(entry)
+            results_by_language.setdefault(entry['language'], []).append(entry)
+        languages_detected = list(results_by_language)
         
         return {
             'text_count': text_count,
@@ -221,25 +724,288 @@ class OCRProcessor:
         }
 
 
+@dataclass
+class OCRBatchResult:
+    """Column-oriented OCR detections, one row per detected text line"""
+    
+    texts: List[str]
+    confidences: np.ndarray  # (N,) float64
+    languages: np.ndarray    # (N,) language codes
+    bboxes: np.ndarray       # (N, 4, 2) corner points
+    centers: np.ndarray      # (N, 2) box centers
+    dims: np.ndarray         # (N, 2) box width and height
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    @classmethod
+    def empty(cls) -> 'OCRBatchResult':
+        """Return a result with no detections"""
+        return cls(
+            texts=[],
+            confidences=np.empty(0, dtype=np.float64),
+            languages=np.empty(0, dtype=str),
+            bboxes=np.empty((0, 4, 2), dtype=np.float32),
+            centers=np.empty((0, 2), dtype=np.float32),
+            dims=np.empty((0, 2), dtype=np.float32)
+        )
+    
+    @classmethod
+    def concatenate(cls, results: List['OCRBatchResult']) -> 'OCRBatchResult':
+        """Stack several results row-wise, preserving their order"""
+        results = [result for result in results if len(result)]
+        if not results:
+            return cls.empty()
+        if len(results) == 1:
+            return results[0]
+        
+        return cls(
+            texts=[text for result in results for text in result.texts],
+            confidences=np.concatenate([result.confidences for result in results]),
+            languages=np.concatenate([result.languages for result in results]),
+            bboxes=np.concatenate([result.bboxes for result in results]),
+            centers=np.concatenate([result.centers for result in results]),
+            dims=np.concatenate([result.dims for result in results])
+        )
+    
+    def to_dicts(self) -> List[Dict]:
+        """Convert to the per-detection dictionaries returned by process_image"""
+        return [
+            {
+                'text': text,
+                'confidence': confidence,
+                'language': language,
+                'bbox': bbox,
+                'center': tuple(center),
+                'dimensions': tuple(dim)
+            }
+            for text, confidence, language, bbox, center, dim in zip(
+                self.texts,
+                self.confidences.tolist(),
+                self.languages.tolist(),
+                self.bboxes.tolist(),
+                self.centers.tolist(),
+                self.dims.tolist()
+            )
+        ]
+
+
+def _tensorrt_available() -> bool:
+    """Check that Paddle was built with TensorRT and the TensorRT runtime loads"""
+    try:
+        import paddle
+        if tuple(paddle.inference.get_trt_compile_version()) == (0, 0, 0):
+            return False
+        return tuple(paddle.inference.get_trt_runtime_version()) != (0, 0, 0)
+    except Exception:
+        return False
+
+
+def _malloc_trim():
+    """Ask glibc to return freed heap memory to the OS (no-op elsewhere)"""
+    libc_name = ctypes.util.find_library('c')
+    if not libc_name:
+        return
+    try:
+        ctypes.CDLL(libc_name).malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _bbox_stats(bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the center and width/height of every bounding box
+    
+    Args:
+        bboxes: Float32 array of shape (N, 4, 2) with the box corner points
+        
+    Returns:
+        Tuple of (centers, dims), each of shape (N, 2)
+    """
+    if NUMBA_AVAILABLE and len(bboxes) >= NUMBA_MIN_BOXES:
+        return _get_bbox_stats_kernel()(np.ascontiguousarray(bboxes))
+    return bboxes.mean(axis=1), bboxes.max(axis=1) - bboxes.min(axis=1)
+
+
+_bbox_stats_kernel = None
+
+
+def _get_bbox_stats_kernel():
+    """Import Numba and compile the bbox kernel on first use"""
+    global _bbox_stats_kernel
+    if _bbox_stats_kernel is not None:
+        return _bbox_stats_kernel
+    
+    import numba
+    
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def kernel(bboxes):
+        """Fused mean/min/max over box corners in a single sweep"""
+        n = bboxes.shape[0]
+        centers = np.empty((n, 2), dtype=np.float32)
+        dims = np.empty((n, 2), dtype=np.float32)
+        for i in numba.prange(n):
+            cx = 0.0
+            cy = 0.0
+            min_x = max_x = bboxes[i, 0, 0]
+            min_y = max_y = bboxes[i, 0, 1]
+            for k in range(4):
+                x = bboxes[i, k, 0]
+                y = bboxes[i, k, 1]
+                cx += x
+                cy += y
+                min_x = min(min_x, x)
+                max_x = max(max_x, x)
+                min_y = min(min_y, y)
+                max_y = max(max_y, y)
+            centers[i, 0] = cx * 0.25
+            centers[i, 1] = cy * 0.25
+            dims[i, 0] = max_x - min_x
+            dims[i, 1] = max_y - min_y
+        return centers, dims
+    
+    _bbox_stats_kernel = kernel
+    return kernel
+
+
+class _RapidOCRAdapter:
+    """Expose a RapidOCR engine through PaddleOCR's predictor attributes"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.text_detector = engine.text_det
+        self.text_classifier = engine.text_cls
+        self.text_recognizer = engine.text_rec
+        self.drop_score = engine.text_score
+
+
+def _sort_boxes(boxes: List) -> List:
+    """
+    Sort boxes into reading order, matching PaddleOCR's sorted_boxes
+    
+    Boxes are ordered top-to-bottom, then left-to-right; boxes whose top-left
+    corners are within BOX_SAME_LINE_TOLERANCE pixels vertically are treated
+    as one line so slightly skewed words keep their left-to-right order.
+    
+    Args:
+        boxes: Bounding boxes [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
+        
+    Returns:
+        The boxes in reading order
+    """
+    boxes = sorted(boxes, key=lambda box: (box[0][1], box[0][0]))
+    for i in range(len(boxes) - 1):
+        for j in range(i, -1, -1):
+            same_line = abs(boxes[j + 1][0][1] - boxes[j][0][1]) < BOX_SAME_LINE_TOLERANCE
+            if same_line and boxes[j + 1][0][0] < boxes[j][0][0]:
+                boxes[j], boxes[j + 1] = boxes[j + 1], boxes[j]
+            else:
+                break
+    return boxes
+
+
+def _crop_text_region(img: np.ndarray, box: List) -> np.ndarray:
+    """
+    Cut a (possibly rotated) quadrilateral text region out of an image
+    
+    Args:
+        img: Source BGR image
+        box: Four corner points [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
+        
+    Returns:
+        Rectified crop, rotated upright if the region is vertical
+    """
+    points = np.array(box, dtype=np.float32)
+    width = int(max(np.linalg.norm(points[0] - points[1]), np.linalg.norm(points[2] - points[3])))
+    height = int(max(np.linalg.norm(points[0] - points[3]), np.linalg.norm(points[1] - points[2])))
+    target = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    
+    matrix = cv2.getPerspectiveTransform(points, target)
+    crop = cv2.warpPerspective(
+        img, matrix, (width, height),
+        borderMode=cv2.BORDER_REPLICATE,
+        flags=cv2.INTER_CUBIC
+    )
+    if crop.shape[0] / max(crop.shape[1], 1) >= 1.5:
+        crop = np.rot90(crop)
+    return crop
+
+
+def _load_font(candidates: Tuple[str, ...], size: int, layout_engine=None):
+    """
+    Load the first available TrueType font from a list of candidates
+    
+    Args:
+        candidates: Font file names, tried in order
+        size: Font size in pixels
+        layout_engine: Optional PIL ImageFont.Layout to shape text with
+        
+    Returns:
+        A PIL font, or None if none of the candidates could be loaded
+    """
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size, layout_engine=layout_engine)
+        except OSError:
+            continue
+    return None
+
+
 def create_sample_image(output_path: str = "sample.jpg"):
     """
     Create a sample image with English and Hindi text for testing
     
     Args:
         output_path: Path where to save the sample image
+        
+    Returns:
+        True on success; False if the image could not be created, including
+        when no Devanagari font is available
     """
     try:
+        # Devanagari matras and conjuncts only render correctly when shaped by raqm
+        if features.check('raqm'):
+            hindi_layout = ImageFont.Layout.RAQM
+        else:
+            hindi_layout = ImageFont.Layout.BASIC
+            logger.warning(
+                "Pillow's raqm text layout is unavailable (usually because libfribidi is not "
+                "installed, e.g. apt install libfribidi0); Hindi lines will not be shaped correctly"
+            )
+        
+        font_hi_title = _load_font(DEVANAGARI_FONTS, 40, hindi_layout)
+        font_hi = _load_font(DEVANAGARI_FONTS, 30, hindi_layout)
+        if font_hi is None:
+            logger.error(
+                f"Failed to create sample image: no Devanagari font found (tried {list(DEVANAGARI_FONTS)}). "
+                "Install a Devanagari font such as Noto Sans Devanagari."
+            )
+            return False
+        
+        font_title = _load_font(ENGLISH_FONTS, 48)
+        font_en = _load_font(ENGLISH_FONTS, 28)
+        if font_en is None:
+            logger.warning(f"None of the fonts {list(ENGLISH_FONTS)} were found, using the default font")
+            font_title = font_en = ImageFont.load_default()
+        
         # Create a white background image
-        img = np.ones((400, 600, 3), dtype=np.uint8) * 255
+        img = Image.new('RGB', (600, 400), 'white')
+        draw = ImageDraw.Draw(img)
         
-        # Add English text
-        cv2.putText(img, "Hello World!", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
-        cv2.putText(img, "This is a sample image", (50, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
-        cv2.putText(img, "for testing OCR functionality", (50, 200), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        lines = [
+            # English text
+            ("Hello World!", (50, 45), font_title),
+            ("This is a sample image", (50, 122), font_en),
+            ("for testing OCR functionality", (50, 172), font_en),
+            # Hindi text (नमस्ते दुनिया = Hello World in Hindi)
+            ("नमस्ते दुनिया", (50, 250), font_hi_title),
+            ("यह एक नमूना छवि है", (50, 315), font_hi),
+        ]
+        for text, position, font in lines:
+            draw.text(position, text, font=font, fill='black')
         
-        # Add Hindi text (नमस्ते दुनिया = Hello World in Hindi)
-        cv2.putText(img, "नमस्ते दुनिया", (50, 300), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 2)
-        cv2.putText(img, "यह एक नमूना छवि है", (50, 350), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+        # PIL renders RGB, OpenCV writes BGR
+        img = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2BGR)
         
         # Save the image
         cv2.imwrite(output_path, img)